@@ -7,18 +7,26 @@ with the CTFd_lab_pods plugin to provide seamless per-team experiences.
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import hmac
 import json
 import logging
+import threading
+from collections import OrderedDict
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from flask.wrappers import Request
 
-from flask import Flask, has_request_context
+from flask import Flask, current_app, g, has_app_context, has_request_context
+from sqlalchemy import event, inspect
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session, object_session
 
+from CTFd.cache import cache
 from CTFd.exceptions.challenges import ChallengeCreateException
-from CTFd.models import Challenges, Flags
+from CTFd.models import Challenges, Flags, db
 from CTFd.plugins import register_plugin_assets_directory
 from CTFd.plugins.challenges import (
     CHALLENGE_CLASSES,
@@ -26,6 +34,7 @@ from CTFd.plugins.challenges import (
 )
 from CTFd.plugins.flags import FLAG_CLASSES, BaseFlag
 from CTFd.plugins.migrations import upgrade
+from CTFd.utils import get_config
 from CTFd.utils.config.pages import build_markdown
 from CTFd.utils.helpers import markup
 from CTFd.utils.user import get_current_team
@@ -47,36 +56,75 @@ except ImportError as exc:  # pragma: no cover
     )
     raise RuntimeError(error_msg) from exc
 
+# Prefer orjson's faster parser for flag data when it is installed
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover
+    _json_loads = json.loads
+
+# Placeholder replaced with the viewer's pod ID in descriptions
+_POD_TOKEN = ":pod_id:"
+
+# Marks per-request memo slots that have not been computed yet
+_UNSET = object()
+
+# Seconds a challenge's pod flag table stays in CTFd's shared cache
+_POD_FLAG_TABLE_TIMEOUT = 300
+
+# Rendered description HTML keyed by (description digest, pod ID, render
+# settings), kept in least-recently-used order
+_HTML_CACHE_MAX_ENTRIES = 1024
+_html_cache: OrderedDict[tuple[bytes, int | None, tuple], str] = OrderedDict()
+_html_cache_lock = threading.Lock()
+
 
 def resolve_current_pod_id() -> int | None:
     """Resolve the active pod identifier for the current request context.
 
     This function determines the pod ID associated with the currently
     authenticated user's team. It handles cases where no request context
-    exists or no team is assigned.
+    exists or no team is assigned. The result is memoized on ``flask.g``
+    so repeated calls within one request hit the database only once.
 
     Returns:
         The pod ID if found, None otherwise.
 
-    Raises:
-        SQLAlchemyError: If database query fails.
-
     """
     if not has_request_context():
         logger.debug("No request context available for pod ID resolution")
         return None
 
+    pod_id = getattr(g, "_pod_id_cache", _UNSET)
+    if pod_id is _UNSET:
+        pod_id = _lookup_current_pod_id()
+        g._pod_id_cache = pod_id
+    return pod_id
+
+
+def _lookup_current_pod_id() -> int | None:
+    """Query the pod assigned to the current team.
+
+    Returns:
+        The pod ID if found, None otherwise.
+
+    """
     try:
-        team = get_current_team()
-        if team is None:
-            logger.debug("No current team found for pod ID resolution")
-            return None
-
-        pod_id = get_team_pod_id(team)
-        if pod_id is not None:
-            logger.debug("Resolved pod ID %s for team %s", pod_id, team.id)
-        else:
-            logger.debug("No pod assigned to team %s", team.id)
+        # Lookups may run mid-submission; don't flush pending objects early
+        with db.session.no_autoflush:
+            team = get_current_team()
+            if team is None:
+                logger.debug("No current team found for pod ID resolution")
+                return None
+
+            # Read a pod column on the team row when present to skip a query
+            pod_id = getattr(team, "pod_id", None)
+            if pod_id is None:
+                pod_id = get_team_pod_id(team)
+        if logger.isEnabledFor(logging.DEBUG):
+            if pod_id is not None:
+                logger.debug("Resolved pod ID %s for team %s", pod_id, team.id)
+            else:
+                logger.debug("No pod assigned to team %s", team.id)
 
     except SQLAlchemyError:
         logger.exception("Database error during pod ID resolution")
@@ -88,6 +136,78 @@ def resolve_current_pod_id() -> int | None:
         return pod_id
 
 
+def _description_digest(description: str) -> bytes:
+    """Return a compact content hash used to key the HTML cache."""
+    return hashlib.blake2b(description.encode("utf-8"), digest_size=16).digest()
+
+
+def _render_settings() -> tuple:
+    """Return the configuration that ``build_markdown`` output depends on.
+
+    Rendering applies HTML sanitization and substitutes CTF variables, so
+    these values are part of the cache key to keep cached HTML current when
+    an admin changes them.
+    """
+    return (
+        current_app.config.get("HTML_SANITIZATION"),
+        get_config("html_sanitization"),
+        get_config("ctf_name"),
+        get_config("ctf_description"),
+        get_config("start"),
+        get_config("end"),
+        get_config("freeze"),
+    )
+
+
+def _render_description(description: str, pod_id: int | None) -> str:
+    """Render a description for a pod, reusing previously rendered HTML.
+
+    Args:
+        description: Raw markdown description of the challenge.
+        pod_id: Pod whose tokens should be substituted, or None to render
+            the description unchanged.
+
+    Returns:
+        The rendered HTML markup.
+
+    """
+    key = (_description_digest(description), pod_id, _render_settings())
+    with _html_cache_lock:
+        cached = _html_cache.get(key)
+        if cached is not None:
+            _html_cache.move_to_end(key)
+            return cached
+
+    source = description
+    if pod_id is not None:
+        source = substitute_pod_tokens(description, pod_id)
+    rendered = markup(build_markdown(source))
+
+    with _html_cache_lock:
+        _html_cache[key] = rendered
+        _html_cache.move_to_end(key)
+        if len(_html_cache) > _HTML_CACHE_MAX_ENTRIES:
+            _html_cache.popitem(last=False)
+    return rendered
+
+
+def invalidate_html_cache(description: str | None = None) -> None:
+    """Drop cached description renders.
+
+    Args:
+        description: Only drop renders of this description. When omitted,
+            the whole cache is cleared.
+
+    """
+    with _html_cache_lock:
+        if description is None:
+            _html_cache.clear()
+            return
+        digest = _description_digest(description)
+        for key in [key for key in _html_cache if key[0] == digest]:
+            del _html_cache[key]
+
+
 class PodSpecificChallenge(Challenges):
     """Challenge model whose description may reference pod identifiers.
 
@@ -112,28 +232,196 @@ class PodSpecificChallenge(Challenges):
             if not description:
                 return ""
 
+            if _POD_TOKEN not in description:
+                # Nothing to substitute; every pod shares the same render
+                return _render_description(description, None)
+
             pod_id = resolve_current_pod_id()
-            if pod_id is not None:
-                description = substitute_pod_tokens(description, pod_id)
-                logger.debug(
-                    "Substituted pod tokens in challenge %s for pod %s",
-                    self.id,
-                    pod_id,
-                )
-            else:
-                logger.debug(
-                    "No pod ID available for challenge %s, using original description",
-                    self.id,
-                )
+            if logger.isEnabledFor(logging.DEBUG):
+                if pod_id is not None:
+                    logger.debug(
+                        "Rendering challenge %s for pod %s",
+                        self.id,
+                        pod_id,
+                    )
+                else:
+                    logger.debug(
+                        "No pod ID available for challenge %s, using original description",
+                        self.id,
+                    )
 
-            return markup(build_markdown(description))
+            return _render_description(description, pod_id)
         except Exception:
             logger.exception(
                 "Error rendering HTML for challenge %s",
                 getattr(self, "id", "unknown"),
             )
-            # Return safe fallback
-            return markup(build_markdown(self.description or ""))
+            # Rendering the same description again would fail the same way
+            return markup("")
+
+
+@event.listens_for(PodSpecificChallenge, "after_update")
+def _invalidate_updated_description(
+    _mapper: object,
+    _connection: object,
+    target: PodSpecificChallenge,
+) -> None:
+    """Evict renders of a description that has just been replaced."""
+    for previous in inspect(target).attrs.description.history.deleted:
+        if previous:
+            invalidate_html_cache(previous)
+
+
+@functools.lru_cache(maxsize=2048)
+def _parse_expected_pod(data: str) -> int | None:
+    """Parse the pod ID stored in a flag's data field.
+
+    The data is either a bare integer or a JSON object with a ``pod_id``
+    key. Results are cached since identical data always parses the same.
+
+    Args:
+        data: The stripped ``Flags.data`` value.
+
+    Returns:
+        The expected pod ID, or None if the data cannot be parsed.
+
+    """
+    digits = data[1:] if data[:1] in ("+", "-") else data
+    if digits.isdecimal():
+        return int(data)
+
+    try:
+        payload = _json_loads(data)
+        return int(payload.get("pod_id", 0))
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+def _flag_digest(value: str) -> bytes:
+    """Return a digest of a flag keyed with the application secret.
+
+    Keying keeps the cached table from being brute-forced offline by anyone
+    who can read CTFd's cache backend.
+    """
+    key = current_app.secret_key
+    if isinstance(key, str):
+        key = key.encode("utf-8")
+    return hmac.new(key, value.encode("utf-8"), hashlib.sha256).digest()
+
+
+def _pod_flag_table_key(challenge_id: int) -> str:
+    return f"pod_specific_flag_digests_{challenge_id}"
+
+
+def _load_pod_flag_table(challenge_id: int) -> dict[int, tuple[bytes, ...]]:
+    """Query a challenge's pod-specific flags grouped by pod ID.
+
+    Args:
+        challenge_id: The challenge whose flags should be loaded.
+
+    Returns:
+        Mapping of pod ID to keyed digests of the accepted flags.
+
+    """
+    rows = (
+        Flags.query.with_entities(Flags.id, Flags.content, Flags.data)
+        .filter_by(challenge_id=challenge_id, type=PodSpecificFlag.name)
+        .all()
+    )
+
+    table: dict[int, list[bytes]] = {}
+    for flag_id, content, data in rows:
+        expected_flag = (content or "").strip()
+        stored_data = (data or "").strip()
+        if not expected_flag or not stored_data:
+            logger.warning("Empty flag content or data for flag %s", flag_id)
+            continue
+
+        expected_pod = _parse_expected_pod(stored_data)
+        if expected_pod is None:
+            logger.error(
+                "Failed to parse pod data for flag %s: %s",
+                flag_id,
+                stored_data,
+            )
+            continue
+
+        table.setdefault(expected_pod, []).append(_flag_digest(expected_flag))
+    return {pod_id: tuple(flags) for pod_id, flags in table.items()}
+
+
+def _get_pod_flag_table(challenge_id: int) -> dict[int, tuple[bytes, ...]]:
+    """Return a challenge's pod flag table, loading it on first use.
+
+    Tables are shared between workers through CTFd's cache and kept on
+    ``flask.g`` for the remainder of the request.
+
+    Args:
+        challenge_id: The challenge whose flags should be returned.
+
+    Returns:
+        Mapping of pod ID to keyed digests of the accepted flags.
+
+    """
+    tables = g.setdefault("_pod_flag_tables", {})
+    table = tables.get(challenge_id)
+    if table is None:
+        key = _pod_flag_table_key(challenge_id)
+        table = cache.get(key)
+        if table is None:
+            table = _load_pod_flag_table(challenge_id)
+            cache.set(key, table, timeout=_POD_FLAG_TABLE_TIMEOUT)
+        tables[challenge_id] = table
+    return table
+
+
+def invalidate_pod_flag_table(challenge_id: int | None) -> None:
+    """Drop the cached pod flag table and verdicts of a challenge.
+
+    Args:
+        challenge_id: The challenge whose flags changed.
+
+    """
+    if challenge_id is None:
+        return
+    cache.delete(_pod_flag_table_key(challenge_id))
+    if has_app_context():
+        g.get("_pod_flag_tables", {}).pop(challenge_id, None)
+        verdicts = g.get("_pod_flag_verdicts", {})
+        for key in [key for key in verdicts if key[0] == challenge_id]:
+            del verdicts[key]
+
+
+@event.listens_for(Flags, "after_insert")
+@event.listens_for(Flags, "after_update")
+@event.listens_for(Flags, "after_delete")
+def _invalidate_changed_flag(
+    _mapper: object,
+    _connection: object,
+    target: Flags,
+) -> None:
+    """Evict the pod flag tables of challenges whose flags changed."""
+    # A flag moved to another challenge affects both its old and new one
+    challenge_ids = {target.challenge_id}
+    challenge_ids.update(inspect(target).attrs.challenge_id.history.deleted)
+    challenge_ids.discard(None)
+
+    for challenge_id in challenge_ids:
+        invalidate_pod_flag_table(challenge_id)
+    # Evict again once committed, in case another worker re-cached the
+    # table from pre-commit rows in the meantime
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault("_pod_flag_tables_changed", set()).update(
+            challenge_ids,
+        )
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_flags(session: Session) -> None:
+    """Evict pod flag tables of challenges whose flag changes committed."""
+    for challenge_id in session.info.pop("_pod_flag_tables_changed", ()):
+        invalidate_pod_flag_table(challenge_id)
 
 
 class PodSpecificFlag(BaseFlag):
@@ -156,10 +444,14 @@ class PodSpecificFlag(BaseFlag):
 
     @staticmethod
     def compare(flag: Flags, provided: str) -> bool:
-        """Validate the submission against the stored pod-specific flag.
+        """Validate the submission against the stored pod-specific flags.
 
         This method performs pod-aware flag validation, ensuring that only
-        users assigned to the correct pod can submit valid flags.
+        users assigned to the correct pod can submit valid flags. The
+        submission is checked against all of the challenge's flags for the
+        user's pod via a cached lookup table, and the verdict is memoized on
+        ``flask.g`` so CTFd's per-row comparison loop only does that work
+        for the first row it checks.
 
         Args:
             flag: The flag object containing the expected value and pod data.
@@ -174,17 +466,8 @@ class PodSpecificFlag(BaseFlag):
             return False
 
         try:
-            expected_flag = (flag.content or "").strip()
-            stored_data = (flag.data or "").strip()
             provided_clean = (provided or "").strip()
 
-            if not expected_flag or not stored_data:
-                logger.warning(
-                    "Empty flag content or data for flag %s",
-                    getattr(flag, "id", "unknown"),
-                )
-                return False
-
             # Resolve current user's pod ID
             pod_id = resolve_current_pod_id()
 
@@ -192,38 +475,38 @@ class PodSpecificFlag(BaseFlag):
                 logger.debug("No pod ID available for flag validation")
                 return False
 
-            # Parse expected pod ID from stored data
-            expected_pod: int | None = None
-            try:
-                expected_pod = int(stored_data)
-            except (TypeError, ValueError):
-                try:
-                    payload = json.loads(stored_data)
-                    expected_pod = int(payload.get("pod_id", 0))
-                except (ValueError, TypeError, json.JSONDecodeError):
-                    logger.exception(
-                        "Failed to parse pod data for flag %s: %s",
-                        getattr(flag, "id", "unknown"),
-                        stored_data,
+            # Every pod-specific row of the challenge yields the same verdict,
+            # so rows after the first one in this request are a dict hit
+            verdicts = g.setdefault("_pod_flag_verdicts", {})
+            verdict_key = (flag.challenge_id, pod_id, provided_clean)
+            cached = verdicts.get(verdict_key)
+            if cached is not None:
+                return cached
+
+            # Look up this pod's flags directly instead of this row's pod
+            candidates = _get_pod_flag_table(flag.challenge_id).get(pod_id, ())
+            if not candidates:
+                verdicts[verdict_key] = False
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "No pod-specific flags for challenge %s and pod %s",
+                        flag.challenge_id,
+                        pod_id,
                     )
-                    return False
-
-            if expected_pod is None or expected_pod != pod_id:
-                logger.debug(
-                    "Pod ID mismatch: expected %s, got %s",
-                    expected_pod,
-                    pod_id,
-                )
                 return False
 
-            # Perform flag comparison
-            result = expected_flag == provided_clean
+            # Compare fixed-size keyed digests in constant time
+            provided_digest = _flag_digest(provided_clean)
+            result = False
+            for expected_digest in candidates:
+                result |= hmac.compare_digest(expected_digest, provided_digest)
+            verdicts[verdict_key] = result
             if result:
                 logger.info(
                     "Successful pod-specific flag validation for pod %s",
                     pod_id,
                 )
-            else:
+            elif logger.isEnabledFor(logging.DEBUG):
                 logger.debug(
                     "Flag content mismatch for pod %s",
                     pod_id,
@@ -321,6 +604,19 @@ class PodSpecificChallengeType(BaseChallenge):
         else:
             return challenge
 
+    @classmethod
+    def delete(cls, challenge: Challenges) -> None:
+        """Delete a pod-specific challenge and its cached flag table.
+
+        Args:
+            challenge: The challenge to delete.
+
+        """
+        challenge_id = challenge.id
+        super().delete(challenge)
+        # Flags are removed with a bulk delete that skips ORM events
+        invalidate_pod_flag_table(challenge_id)
+
 
 def load(app: Flask) -> None:
     """Register the pod specific challenge type with the application.
@@ -341,7 +637,7 @@ def load(app: Flask) -> None:
 
         # Run database migrations
         logger.debug("Running database migrations")
-        upgrade(plugin_name="pod_specific_challenges")
+        upgrade()
 
         # Register challenge type
         logger.debug("Registering challenge type: %s", PodSpecificChallengeType.id)
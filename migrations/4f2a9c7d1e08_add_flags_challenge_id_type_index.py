@@ -0,0 +1,49 @@
+"""Add composite index on flags for pod-specific lookups
+
+Revision ID: 4f2a9c7d1e08
+Revises: b1c9a783c5c3
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import sqlalchemy as sa
+
+if TYPE_CHECKING:
+    from alembic.operations import Operations
+
+revision = "4f2a9c7d1e08"
+down_revision = "b1c9a783c5c3"
+branch_labels = None
+depends_on = None
+
+INDEX_NAME = "ix_flags_challenge_id_type"
+CHALLENGE_INDEX_NAME = "ix_flags_challenge_id"
+
+
+def _has_challenge_id_index(op: Operations) -> bool:
+    """Return whether flags has an index leading on challenge_id besides ours."""
+    indexes = sa.inspect(op.get_bind()).get_indexes("flags")
+    return any(
+        index["name"] != INDEX_NAME and index["column_names"][:1] == ["challenge_id"]
+        for index in indexes
+    )
+
+
+def upgrade(op: Operations) -> None:
+    """Index flags by challenge and type for pod flag table loads."""
+    op.create_index(INDEX_NAME, "flags", ["challenge_id", "type"], unique=False)
+
+
+def downgrade(op: Operations) -> None:
+    """Remove the composite flags index."""
+    dialect = op.get_bind().dialect.name
+    if dialect in ("mysql", "mariadb") and not _has_challenge_id_index(op):
+        # MySQL may have dropped the foreign key's own challenge_id index in
+        # favour of the composite one, and refuses to drop the only index
+        # backing a foreign key. Give the constraint its own index first.
+        op.create_index(CHALLENGE_INDEX_NAME, "flags", ["challenge_id"], unique=False)
+    op.drop_index(INDEX_NAME, table_name="flags")
@@ -8,15 +8,20 @@ Create Date: 2024-05-06 00:00:00.000000
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from alembic.operations import Operations
+
 revision = "b1c9a783c5c3"
 down_revision = None
 branch_labels = None
 depends_on = None
 
 
-def upgrade(_: object = None) -> None:
+def upgrade(op: Operations) -> None:
     """No database changes needed for pod-specific challenges."""
 
 
-def downgrade(_: object = None) -> None:
+def downgrade(op: Operations) -> None:
     """No database changes needed for pod-specific challenges."""